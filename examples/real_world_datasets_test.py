@@ -11,14 +11,26 @@ import numpy as np
 import networkx as nx
 import pandas as pd
 import plotly.express as px
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import ArpackNoConvergence
 
 from graphem.embedder import GraphEmbedder
+from graphem._kernels import canonical_edges, edges_to_csr, adjacency_matrix, fast_eigenvector_centrality, fast_pagerank
 from graphem.visualization import report_full_correlation_matrix
 from graphem.datasets import (
     list_available_datasets,
     load_dataset,
 )
 
+# Numba-compiled BFS kernels, with NetworkX as the fallback
+try:
+    from graphem._kernels.bfs import closeness_csr, all_pairs_stats
+    from graphem._kernels.components import union_find_components
+    from graphem._kernels.sampling import partial_perm
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 def print_available_datasets():
     """
@@ -54,6 +66,127 @@ def print_available_datasets():
     print("\nTo use a dataset, call load_dataset('dataset-name') or load_dataset_as_networkx('dataset-name')")
 
 
+# Label range above which sample_subgraph switches from a dense remap array
+# to sorted membership tests. Both take about the same time at 1e7 labels
+# (2M edges, 100k sampled vertices), where the dense array already needs 40 MB.
+DENSE_REMAP_MAX_LABEL = 10_000_000
+
+
+def sample_vertices(vertices, sample_size):
+    """
+    Sample vertices uniformly without replacement.
+    
+    With Numba, a partial Fisher-Yates shuffle takes O(sample_size) time and
+    memory instead of the O(len(vertices)) permutation of np.random.choice.
+    
+    Parameters:
+        vertices: np.ndarray of shape (num_vertices,)
+            Vertex labels to sample from
+        sample_size: int
+            Number of vertices to sample
+    
+    Returns:
+        np.ndarray of shape (sample_size,): The sampled vertex labels
+    """
+    if NUMBA_AVAILABLE:
+        return vertices[partial_perm(len(vertices), sample_size, np.random.randint(2 ** 31 - 1))]
+    return np.random.choice(vertices, sample_size, replace=False)
+
+
+def sample_subgraph(sampled_vertices, edges):
+    """
+    Restrict a graph to the given vertices and relabel them as 0..k-1.
+    
+    The returned edges are canonical (see canonical_edges): reciprocal and
+    repeated pairs, as in the directed SNAP datasets, appear once.
+    
+    Parameters:
+        sampled_vertices: np.ndarray of shape (k,)
+            Original labels of the vertices to keep
+        edges: np.ndarray of shape (num_edges, 2)
+            Edge list using the original vertex labels
+    
+    Returns:
+        tuple: (vertices, edges)
+            vertices: np.ndarray of shape (k,) with labels 0..k-1
+            edges: np.ndarray of shape (num_sampled_edges, 2) with relabeled, unique edges
+    """
+    sample_size = len(sampled_vertices)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    max_label = max(edges.max(initial=-1), np.max(sampled_vertices))
+    
+    if max_label < DENSE_REMAP_MAX_LABEL:
+        # Dense label -> sample index map, -1 for vertices outside the sample
+        remap = -np.ones(max_label + 1, dtype=np.int32)
+        remap[sampled_vertices] = np.arange(sample_size, dtype=np.int32)
+        
+        # Keep edges with both endpoints in the sample
+        mask = (remap[edges[:, 0]] >= 0) & (remap[edges[:, 1]] >= 0)
+        return np.arange(sample_size), canonical_edges(remap[edges[mask]])
+    
+    # Sparse label range: membership tests against the sorted sample
+    order = np.argsort(sampled_vertices)
+    sorted_sample = sampled_vertices[order]
+    mask = np.isin(edges[:, 0], sorted_sample) & np.isin(edges[:, 1], sorted_sample)
+    
+    # Same labels as the dense path: position in sampled_vertices
+    return np.arange(sample_size), canonical_edges(order[np.searchsorted(sorted_sample, edges[mask])])
+
+
+def largest_component(edges, n_vertices):
+    """
+    Extract the largest connected component of a graph on vertices 0..n-1.
+    
+    Parameters:
+        edges: np.ndarray of shape (num_edges, 2)
+            Edge list of the graph
+        n_vertices: int
+            Number of vertices
+    
+    Returns:
+        tuple: (edges, lcc_size, num_components)
+            edges: np.ndarray of shape (num_lcc_edges, 2) of unique edges relabeled to 0..lcc_size-1
+            lcc_size: int, number of vertices in the largest component
+            num_components: int, number of connected components
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if NUMBA_AVAILABLE:
+        labels = union_find_components(edges, n_vertices)
+    else:
+        _, labels = connected_components(adjacency_matrix(*edges_to_csr(edges, n_vertices)), directed=False)
+    
+    sizes = np.bincount(labels, minlength=n_vertices)
+    largest = np.argmax(sizes)
+    keep = labels == largest
+    
+    # Relabel the kept vertices as 0..lcc_size-1
+    remap = -np.ones(n_vertices, dtype=np.int64)
+    remap[keep] = np.arange(sizes[largest])
+    mask = keep[edges[:, 0]]
+    
+    return canonical_edges(remap[edges[mask]]), int(sizes[largest]), int(np.count_nonzero(sizes))
+
+
+def shortest_path_stats(G, indptr, indices):
+    """
+    Compute the diameter and average shortest path length of a connected graph.
+    
+    Uses the parallel Numba BFS kernel when available, and NetworkX otherwise.
+    
+    Parameters:
+        G: networkx.Graph
+            Graph with vertices 0..n-1
+        indptr, indices: np.ndarray
+            CSR adjacency of the same graph
+    
+    Returns:
+        tuple: (diameter, avg_path_length)
+    """
+    if NUMBA_AVAILABLE:
+        return all_pairs_stats(indptr, indices)
+    return nx.diameter(G), nx.average_shortest_path_length(G)
+
+
 def analyze_dataset(dataset_name, sample_size=None, dim=3, num_iterations=30):
     """
     Download, load, and analyze a dataset.
@@ -84,28 +217,16 @@ def analyze_dataset(dataset_name, sample_size=None, dim=3, num_iterations=30):
     # Sample the graph if needed
     if sample_size is not None and sample_size < n_vertices:
         print(f"Sampling {sample_size:,} vertices from the graph...")
-        sampled_vertices = np.random.choice(vertices, sample_size, replace=False)
-        
-        # Filter edges that contain sampled vertices
-        sampled_edges = []
-        for u, v in edges:
-            if u in sampled_vertices and v in sampled_vertices:
-                sampled_edges.append((u, v))
-        
-        vertices = sampled_vertices
-        edges = np.array(sampled_edges)
+        sampled_vertices = sample_vertices(vertices, sample_size)
+        vertices, edges = sample_subgraph(sampled_vertices, edges)
         n_vertices = sample_size
         
         print(f"Sampled graph has {n_vertices:,} vertices and {len(edges):,} edges")
-    
-    # Create NetworkX graph for analysis
-    G = nx.Graph()
-    G.add_nodes_from(vertices)
-    G.add_edges_from(edges)
-    G = nx.convert_node_labels_to_integers(G,
-                                           first_label=0,
-                                           ordering='default',
-                                           label_attribute=None)
+    elif not np.array_equal(vertices, np.arange(n_vertices)):
+        # Re-index nodes to be consecutive integers
+        vertices, edges = sample_subgraph(vertices, edges)
+    else:
+        edges = canonical_edges(edges)
     
     # Analyze graph properties
     density = 2 * len(edges) / (n_vertices * (n_vertices - 1))
@@ -116,43 +237,34 @@ def analyze_dataset(dataset_name, sample_size=None, dim=3, num_iterations=30):
     print(f"- Average degree: {avg_degree:.2f}")
     
     # Measure connected components
-    components = list(nx.connected_components(G))
-    print(f"- Number of connected components: {len(components):,}")
-    print(f"- Largest component size: {len(max(components, key=len)):,} vertices")
+    cc_edges, lcc_size, num_components = largest_component(edges, n_vertices)
+    print(f"- Number of connected components: {num_components:,}")
+    print(f"- Largest component size: {lcc_size:,} vertices")
     
     # Analyze largest connected component
-    G_cc = G
-    largest_cc = max(components, key=len)
-    if len(largest_cc) < n_vertices:
-        print(f"Extracting largest connected component with {len(largest_cc):,} vertices...")
-        G_cc = G.subgraph(largest_cc).copy()
-        
-        # Re-index nodes to be consecutive integers
-        G_cc = nx.convert_node_labels_to_integers(G_cc)
-        
-        # Extract edges from the largest component
-        n_vertices = len(largest_cc)
+    if lcc_size < n_vertices:
+        print(f"Extracting largest connected component with {lcc_size:,} vertices...")
+        n_vertices = lcc_size
     
-    # Compute diameter if manageable
-    if n_vertices < 10000:
-        try:
-            diameter = nx.diameter(G_cc)
-            print(f"- Diameter: {diameter}")
-        except nx.NetworkXError as e:
-            print("- Diameter: N/A")
-            print(e)
-    else:
-        print("- Diameter: Skipped (Graph too large)")
+    G_cc = nx.Graph()
+    G_cc.add_nodes_from(range(n_vertices))
+    G_cc.add_edges_from(cc_edges)
     
-    # Compute average shortest path length if manageable
-    if n_vertices < 10000:
+    # CSR adjacency shared by the BFS and centrality kernels
+    indptr, indices = edges_to_csr(cc_edges, n_vertices)
+    
+    # Compute diameter and average shortest path length if manageable
+    if n_vertices < (100000 if NUMBA_AVAILABLE else 10000):
         try:
-            avg_path_length = nx.average_shortest_path_length(G_cc)
+            diameter, avg_path_length = shortest_path_stats(G_cc, indptr, indices)
+            print(f"- Diameter: {diameter}")
             print(f"- Average shortest path length: {avg_path_length:.2f}")
-        except nx.NetworkXError as e:
+        except (nx.NetworkXError, ValueError) as e:
+            print("- Diameter: N/A")
             print("- Average shortest path length: N/A")
             print(e)
     else:
+        print("- Diameter: Skipped (Graph too large)")
         print("- Average shortest path length: Skipped (Graph too large)")
     
     # Compute clustering coefficient
@@ -163,7 +275,7 @@ def analyze_dataset(dataset_name, sample_size=None, dim=3, num_iterations=30):
     print(f"Creating embedding in dimension {dim}...")
     # Create and run embedder
     embedder = GraphEmbedder(
-        edges=G_cc.edges,
+        edges=cc_edges,
         n_vertices=G_cc.number_of_nodes(),
         dimension=dim,
         L_min=4.0,
@@ -188,8 +300,8 @@ def analyze_dataset(dataset_name, sample_size=None, dim=3, num_iterations=30):
     positions = np.array(embedder.positions)
     radii = np.linalg.norm(positions, axis=1)
     
-    # Calculate centrality measures
-    degree = np.array([d for _, d in G_cc.degree()])
+    # Calculate centrality measures; a self-loop adds 2 to the degree, as in NetworkX
+    degree = np.bincount(cc_edges.ravel(), minlength=n_vertices)
     
     # Only calculate betweenness for smaller graphs
     if n_vertices < 5000:
@@ -199,20 +311,27 @@ def analyze_dataset(dataset_name, sample_size=None, dim=3, num_iterations=30):
         print("Skipping betweenness centrality (graph too large)")
         betweenness = np.zeros(n_vertices)
     
+    # Sparse adjacency shared by the eigenvector and PageRank computations
+    A = adjacency_matrix(indptr, indices)
+    
     print("Calculating eigenvector centrality...")
     try:
-        eigenvector = np.array(list(nx.eigenvector_centrality_numpy(G_cc).values()))
-    except nx.NetworkXError as e:
+        eigenvector = fast_eigenvector_centrality(A)
+    except ArpackNoConvergence as e:
         print("Error calculating eigenvector centrality, using zeros")
         print(e)
         eigenvector = np.zeros(n_vertices)
     
     print("Calculating PageRank...")
-    pagerank = np.array(list(nx.pagerank(G_cc).values()))
-    
-    print("Calculating closeness centrality...")
-    if n_vertices < 5000:
-        closeness = np.array(list(nx.closeness_centrality(G_cc).values()))
+    pagerank = fast_pagerank(A)
+    
+    # Only calculate closeness for graphs the all-sources BFS can handle
+    if n_vertices < (100000 if NUMBA_AVAILABLE else 5000):
+        print("Calculating closeness centrality...")
+        if NUMBA_AVAILABLE:
+            closeness = closeness_csr(indptr, indices)
+        else:
+            closeness = np.array(list(nx.closeness_centrality(G_cc).values()))
     else:
         print("Skipping closeness centrality (graph too large)")
         closeness = np.zeros(n_vertices)
@@ -256,8 +375,9 @@ def compare_datasets(dataset_names, sample_size=1000, dim=3, num_iterations=30):
     Parameters:
         dataset_names: list
             The list of dataset names to compare
-        sample_size: int
-            Sample size for each dataset
+        sample_size: int or None
+            Sample size for each dataset; datasets with at most this many
+            vertices (or all datasets, if None) are used whole
         dim: int
             Dimension of the embedding
         num_iterations: int
@@ -283,70 +403,53 @@ def compare_datasets(dataset_names, sample_size=1000, dim=3, num_iterations=30):
         
         print(f"Loaded dataset with {n_vertices:,} vertices and {len(edges):,} edges in {load_time:.2f}s")
         
-        # Sample the graph
-        print(f"Sampling {sample_size:,} vertices from the graph...")
-        sampled_vertices = np.random.choice(vertices, sample_size, replace=False)
-        
-        # Filter edges that contain sampled vertices
-        sampled_edges = []
-        for u, v in edges:
-            if u in sampled_vertices and v in sampled_vertices:
-                sampled_edges.append((u, v))
-
-        vertices = sampled_vertices
-        edges = np.array(sampled_edges)
-        n_vertices = sample_size
-        
-        print(f"Sampled graph has {n_vertices:,} vertices and {len(edges):,} edges")
-        
-        # Create NetworkX graph for analysis
-        G = nx.Graph()
-        G.add_nodes_from(vertices)
-        G.add_edges_from(edges)
-        G = nx.convert_node_labels_to_integers(G,
-                                               first_label=0,
-                                               ordering='default',
-                                               label_attribute=None)
+        # Sample the graph, unless the sample would be the whole graph
+        if sample_size is not None and sample_size < n_vertices:
+            print(f"Sampling {sample_size:,} vertices from the graph...")
+            sampled_vertices = sample_vertices(vertices, sample_size)
+            vertices, edges = sample_subgraph(sampled_vertices, edges)
+            n_vertices = sample_size
+            
+            print(f"Sampled graph has {n_vertices:,} vertices and {len(edges):,} edges")
+        elif not np.array_equal(vertices, np.arange(n_vertices)):
+            # Re-index nodes to be consecutive integers
+            vertices, edges = sample_subgraph(vertices, edges)
+        else:
+            edges = canonical_edges(edges)
         
         # Analyze graph properties
         density = 2 * len(edges) / (n_vertices * (n_vertices - 1))
         avg_degree = 2 * len(edges) / n_vertices
         
         # Get largest connected component
-        largest_cc = max(nx.connected_components(G), key=len)
-        lcc_size = len(largest_cc)
+        cc_edges, lcc_size, _ = largest_component(edges, n_vertices)
         lcc_fraction = lcc_size / n_vertices
 
         # Analyze largest connected component
-        G_cc = G
-        if len(largest_cc) < n_vertices:
-            print(f"Extracting largest connected component with {len(largest_cc):,} vertices...")
-            G_cc = G.subgraph(largest_cc).copy()
-
-            # Re-index nodes to be consecutive integers
-            G_cc = nx.convert_node_labels_to_integers(G_cc)
-
-            # Extract edges from the largest component
-            edges = G_cc.edges
-            n_vertices = len(largest_cc)
-        
-        # Compute average shortest path length if manageable
-        try:
-            diameter = nx.diameter(G_cc)
-        except nx.NetworkXError as e:
-            print("- Diameter: N/A")
-            print(e)
-            diameter = float('nan')
+        if lcc_size < n_vertices:
+            print(f"Extracting largest connected component with {lcc_size:,} vertices...")
+            n_vertices = lcc_size
+        edges = cc_edges
         
-        try:
-            avg_path_length = nx.average_shortest_path_length(G_cc)
-        except nx.NetworkXError as e:
-            print("- Average shortest path length: N/A")
-            print(e)
-            avg_path_length = float('nan')
+        G_cc = nx.Graph()
+        G_cc.add_nodes_from(range(n_vertices))
+        G_cc.add_edges_from(edges)
         
-        # Compute clustering coefficient
-        avg_clustering = nx.average_clustering(G_cc)
+        # Compute diameter, average shortest path length and clustering if manageable
+        diameter = float('nan')
+        avg_path_length = float('nan')
+        avg_clustering = float('nan')
+        if n_vertices < (100000 if NUMBA_AVAILABLE else 10000):
+            try:
+                diameter, avg_path_length = shortest_path_stats(G_cc, *edges_to_csr(edges, n_vertices))
+            except (nx.NetworkXError, ValueError) as e:
+                print("- Diameter: N/A")
+                print("- Average shortest path length: N/A")
+                print(e)
+            
+            avg_clustering = nx.average_clustering(G_cc)
+        else:
+            print("- Diameter, average path length and clustering: Skipped (Graph too large)")
         
         # Create and run embedder
         embedder = GraphEmbedder(
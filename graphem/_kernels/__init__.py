@@ -0,0 +1,12 @@
+"""
+Compiled graph kernels for Graphem.
+
+These kernels operate on graphs stored in compressed sparse row (CSR) form
+and back the centrality computations in the benchmarks. The Numba-based
+kernels are optional: import them directly and fall back to NetworkX when
+Numba is not installed.
+"""
+
+from graphem._kernels.csr import canonical_edges, edges_to_csr
+from graphem._kernels.spectral import adjacency_matrix, fast_eigenvector_centrality, fast_pagerank
+from graphem._kernels.cascade_numpy import ic_simulate_numpy
@@ -0,0 +1,216 @@
+"""
+Numba BFS kernels on CSR graphs: closeness and load centrality, and
+all-pairs shortest path statistics.
+"""
+
+import numpy as np
+import numba
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _bfs_distances(indptr, indices, s, dist, queue):
+    """
+    Run a BFS from s, filling dist for the reached vertices.
+
+    Each vertex is enqueued at most once, so a queue of length n never wraps.
+    Returns the number of reached vertices (including s) and the sum of their
+    distances from s; queue[:reached] lists them in BFS order.
+    """
+    dist[s] = 0
+    queue[0] = s
+    head = 0
+    tail = 1
+    total = 0
+    while head < tail:
+        v = queue[head]
+        head += 1
+        total += dist[v]
+        for j in range(indptr[v], indptr[v + 1]):
+            w = indices[j]
+            if dist[w] < 0:
+                dist[w] = dist[v] + 1
+                queue[tail] = w
+                tail += 1
+    return tail, total
+
+
+@njit(parallel=True, cache=True)
+def _closeness_parallel(indptr, indices, n_chunks, closeness):
+    """
+    Closeness of every vertex written into closeness, with sources split into
+    n_chunks interleaved groups that each own their dist and queue buffers.
+    """
+    n = indptr.shape[0] - 1
+    for c in prange(n_chunks):
+        dist = np.full(n, -1, dtype=np.int32)
+        queue = np.empty(n, dtype=np.int64)
+        for s in range(c, n, n_chunks):
+            reached, total = _bfs_distances(indptr, indices, s, dist, queue)
+            if total > 0 and n > 1:
+                # Wasserman-Faust scaling for disconnected graphs
+                closeness[s] = (reached - 1) / total * (reached - 1) / (n - 1)
+            # Reset only the vertices this BFS touched
+            for i in range(reached):
+                dist[queue[i]] = -1
+    return closeness
+
+
+def closeness_csr(indptr, indices, dtype=np.float64):
+    """
+    Compute the closeness centrality of an undirected, unweighted graph.
+
+    The result matches networkx.closeness_centrality on the same graph,
+    including its scaling by the size of the reachable set.
+
+    Parameters:
+        indptr: np.ndarray of shape (n + 1,)
+            CSR row offsets of the symmetric adjacency
+        indices: np.ndarray of shape (2 * num_edges,)
+            CSR column indices of the symmetric adjacency
+        dtype: np.dtype
+            Type of the returned centralities
+
+    Returns:
+        np.ndarray of shape (n,): Closeness centrality of each vertex
+    """
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    n = len(indptr) - 1
+    closeness = np.zeros(n, dtype=dtype)
+    if n == 0:
+        return closeness
+
+    n_chunks = min(numba.get_num_threads(), n)
+    _closeness_parallel(indptr, indices, n_chunks, closeness)
+    return closeness
+
+
+@njit(parallel=True, cache=True)
+def _load_parallel(indptr, indices, n_chunks):
+    """
+    Load of every vertex, with sources split into n_chunks interleaved groups
+    that each own their buffers and output row.
+
+    Following Newman, every vertex reached from s carries one unit of load
+    plus what it receives, and passes it on split equally among its
+    predecessors, i.e. the neighbors one step closer to s.
+    """
+    n = indptr.shape[0] - 1
+    partial_load = np.zeros((n_chunks, n))
+    for c in prange(n_chunks):
+        dist = np.full(n, -1, dtype=np.int32)
+        queue = np.empty(n, dtype=np.int64)
+        between = np.zeros(n)
+        load = partial_load[c]
+        for s in range(c, n, n_chunks):
+            reached, _ = _bfs_distances(indptr, indices, s, dist, queue)
+            for i in range(reached):
+                between[queue[i]] = 1.0
+            # Farthest vertices first
+            for i in range(reached - 1, 0, -1):
+                w = queue[i]
+                d = dist[w] - 1
+                num_pred = 0
+                for j in range(indptr[w], indptr[w + 1]):
+                    if dist[indices[j]] == d:
+                        num_pred += 1
+                share = between[w] / num_pred
+                for j in range(indptr[w], indptr[w + 1]):
+                    u = indices[j]
+                    if dist[u] == d and u != s:
+                        between[u] += share
+            for i in range(reached):
+                v = queue[i]
+                load[v] += between[v] - 1.0
+                dist[v] = -1
+    return partial_load.sum(axis=0)
+
+
+def load_csr(indptr, indices, normalized=True):
+    """
+    Compute the load centrality of an undirected, unweighted graph.
+
+    The result matches networkx.load_centrality on the same graph.
+
+    Parameters:
+        indptr: np.ndarray of shape (n + 1,)
+            CSR row offsets of the symmetric adjacency
+        indices: np.ndarray of shape (2 * num_edges,)
+            CSR column indices of the symmetric adjacency
+        normalized: bool
+            If True, divide by (n - 1)(n - 2)
+
+    Returns:
+        np.ndarray of shape (n,): Load centrality of each vertex
+    """
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    n = len(indptr) - 1
+    if n == 0:
+        return np.zeros(0)
+
+    n_chunks = min(numba.get_num_threads(), n)
+    load = _load_parallel(indptr, indices, n_chunks)
+    if normalized and n > 2:
+        load *= 1.0 / ((n - 1) * (n - 2))
+    return load
+
+
+@njit(parallel=True, cache=True)
+def _all_pairs_parallel(indptr, indices, n_chunks):
+    """
+    Eccentricity maximum, distance sum and unreached count over all sources,
+    with sources split into n_chunks interleaved groups that each own their
+    buffers and accumulator slots.
+    """
+    n = indptr.shape[0] - 1
+    max_dist = np.zeros(n_chunks, dtype=np.int64)
+    total = np.zeros(n_chunks, dtype=np.int64)
+    unreached = np.zeros(n_chunks, dtype=np.int64)
+    for c in prange(n_chunks):
+        dist = np.full(n, -1, dtype=np.int32)
+        queue = np.empty(n, dtype=np.int64)
+        for s in range(c, n, n_chunks):
+            reached, dist_sum = _bfs_distances(indptr, indices, s, dist, queue)
+            total[c] += dist_sum
+            unreached[c] += n - reached
+            # The last vertex in BFS order is the farthest one
+            max_dist[c] = max(max_dist[c], dist[queue[reached - 1]])
+            for i in range(reached):
+                dist[queue[i]] = -1
+    return max_dist.max(), total.sum(), unreached.sum()
+
+
+def all_pairs_stats(indptr, indices):
+    """
+    Compute the diameter and average shortest path length of a connected,
+    undirected, unweighted graph.
+
+    The results match networkx.diameter and
+    networkx.average_shortest_path_length on the same graph.
+
+    Parameters:
+        indptr: np.ndarray of shape (n + 1,)
+            CSR row offsets of the symmetric adjacency
+        indices: np.ndarray of shape (2 * num_edges,)
+            CSR column indices of the symmetric adjacency
+
+    Returns:
+        tuple: (diameter, avg_path_length)
+            diameter: int, largest distance between two vertices
+            avg_path_length: float, mean distance over ordered pairs of distinct vertices
+    """
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    n = len(indptr) - 1
+    if n == 0:
+        raise ValueError("Graph has no vertices")
+    if n == 1:
+        return 0, 0.0
+
+    n_chunks = min(numba.get_num_threads(), n)
+    diameter, total, unreached = _all_pairs_parallel(indptr, indices, n_chunks)
+    if unreached > 0:
+        raise ValueError("Graph is not connected")
+    return int(diameter), total / (n * (n - 1))
@@ -0,0 +1,61 @@
+"""
+Numba union-find for the connected components of an edge list.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _find(parent, x):
+    """
+    Root of x, compressing the path from x to the root.
+    """
+    root = x
+    while parent[root] != root:
+        root = parent[root]
+    while parent[x] != root:
+        nxt = parent[x]
+        parent[x] = root
+        x = nxt
+    return root
+
+
+@njit(cache=True)
+def _union_find(edges, n):
+    """
+    Union by rank over all edges, then point every vertex at its root.
+    """
+    parent = np.arange(n)
+    rank = np.zeros(n, dtype=np.int8)
+    for i in range(edges.shape[0]):
+        a = _find(parent, edges[i, 0])
+        b = _find(parent, edges[i, 1])
+        if a == b:
+            continue
+        if rank[a] < rank[b]:
+            a, b = b, a
+        parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+    for v in range(n):
+        parent[v] = _find(parent, v)
+    return parent
+
+
+def union_find_components(edges, n):
+    """
+    Label the connected components of an undirected graph.
+
+    Parameters:
+        edges: np.ndarray of shape (num_edges, 2)
+            Array of edge pairs (i, j)
+        n: int
+            Number of vertices
+
+    Returns:
+        np.ndarray of shape (n,): For each vertex, the representative vertex
+        of its component; np.bincount of the labels gives component sizes
+    """
+    edges = np.ascontiguousarray(np.asarray(edges, dtype=np.int64).reshape(-1, 2))
+    return _union_find(edges, n)
@@ -0,0 +1,60 @@
+"""
+Conversion of edge lists to compressed sparse row (CSR) adjacency arrays.
+"""
+
+import numpy as np
+
+
+def canonical_edges(edges):
+    """
+    Reduce an edge list to the simple undirected graph it describes.
+
+    Each edge is written as (min, max) and repeated edges are dropped, so
+    reciprocal pairs (i, j), (j, i) and parallel edges count once, as in a
+    networkx.Graph. Self-loops are kept.
+
+    Parameters:
+        edges: np.ndarray of shape (num_edges, 2)
+            Array of edge pairs (i, j)
+
+    Returns:
+        np.ndarray of shape (num_unique_edges, 2): Sorted unique edges with i <= j
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    return np.unique(np.sort(edges, axis=1), axis=0)
+
+
+def edges_to_csr(edges, n):
+    """
+    Build the symmetric CSR adjacency of an undirected graph.
+
+    The edges are first reduced with canonical_edges, so duplicate and
+    reciprocal pairs are stored once. Every other edge (i, j) is stored in
+    both directions; a self-loop appears once in its vertex's row, matching
+    the adjacency matrix of a networkx.Graph.
+
+    Parameters:
+        edges: np.ndarray of shape (num_edges, 2)
+            Array of edge pairs (i, j)
+        n: int
+            Number of vertices
+
+    Returns:
+        tuple: (indptr, indices)
+            indptr: np.ndarray of shape (n + 1,)
+                Row offsets; the neighbors of v are indices[indptr[v]:indptr[v + 1]]
+            indices: np.ndarray of shape (nnz,)
+                Concatenated neighbor lists
+    """
+    edges = canonical_edges(edges)
+    loops = edges[:, 0] == edges[:, 1]
+    src = np.concatenate((edges[:, 0], edges[~loops, 1]))
+    dst = np.concatenate((edges[:, 1], edges[~loops, 0]))
+
+    # Row offsets from the degrees
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+
+    # Scatter the neighbors into their rows
+    indices = dst[np.argsort(src, kind='stable')]
+    return indptr, indices
@@ -0,0 +1,44 @@
+"""
+Numba sampling of vertex subsets without replacement.
+"""
+
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict
+
+
+@njit(cache=True)
+def _partial_fisher_yates(n, seed, out):
+    """
+    Fill out with the first len(out) entries of a random permutation of
+    0..n-1. Only the swapped positions are stored, in a hash map, so time
+    and memory are O(k) rather than O(n).
+    """
+    np.random.seed(seed)
+    swap = Dict.empty(key_type=types.int64, value_type=types.int64)
+    for i in range(out.shape[0]):
+        j = np.random.randint(i, n)
+        out[i] = swap.get(j, j)
+        swap[j] = swap.get(i, i)
+
+
+def partial_perm(n, k, seed):
+    """
+    Sample k distinct integers from 0..n-1 uniformly at random.
+
+    Parameters:
+        n: int
+            Size of the range to sample from
+        k: int
+            Number of samples, at most n
+        seed: int
+            Random seed for reproducibility
+
+    Returns:
+        np.ndarray of shape (k,): The samples, as int32 when n < 2^31
+    """
+    if k > n:
+        raise ValueError("Cannot sample more than n integers without replacement")
+    out = np.empty(k, dtype=np.int32 if n < 2 ** 31 else np.int64)
+    _partial_fisher_yates(n, seed, out)
+    return out
@@ -6,10 +6,39 @@ import time
 import numpy as np
 import networkx as nx
 from scipy import stats
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import ArpackNoConvergence
 from loguru import logger
 
 from graphem.embedder import GraphEmbedder
-from graphem.influence import graphem_seed_selection, ndlib_estimated_influence, greedy_seed_selection
+from graphem.influence import graphem_seed_selection
+from graphem._kernels import (canonical_edges, edges_to_csr, adjacency_matrix, fast_eigenvector_centrality,
+                              fast_pagerank, ic_simulate_numpy)
+
+# Numba-compiled centrality kernels, with NetworkX as the fallback
+try:
+    from graphem._kernels.brandes import betweenness_csr
+    from graphem._kernels.bfs import closeness_csr, load_csr
+    from graphem._kernels.cascade import ic_simulate_batch
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _dict_to_array(d, n):
+    """
+    Convert a NetworkX per-node result with keys 0..n-1 to an array.
+    
+    Parameters:
+        d: dict
+            Mapping from vertex to value
+        n: int
+            Number of vertices
+    
+    Returns:
+        np.ndarray of shape (n,): d[i] at position i
+    """
+    return np.fromiter((d[i] for i in range(n)), dtype=np.float64, count=n)
 
 
 def run_benchmark(graph_generator, graph_params, dim=3, L_min=10.0, k_attr=0.5, k_inter=0.1, 
@@ -49,47 +78,56 @@ def run_benchmark(graph_generator, graph_params, dim=3, L_min=10.0, k_attr=0.5,
     
     logger.info(f"Generated graph with {n} vertices and {m} edges")
     
-    # Convert to NetworkX graph for centrality calculations
-    nx_graph = nx.Graph()
-    nx_graph.add_nodes_from(range(n))
-    nx_graph.add_edges_from(edges)
+    # NetworkX is only needed for the fallbacks when Numba is missing
+    need_nx = not NUMBA_AVAILABLE
+    if need_nx:
+        nx_graph = nx.Graph()
+        nx_graph.add_nodes_from(range(n))
+        nx_graph.add_edges_from(edges)
+    
+    # Simple-graph edges, counting duplicate and reciprocal pairs once as NetworkX does
+    simple_edges = canonical_edges(edges)
+    
+    # CSR adjacency shared by all centrality kernels
+    indptr, indices = edges_to_csr(simple_edges, n)
+    
+    # Single precision is enough for the rank correlations computed from these
+    A = adjacency_matrix(indptr, indices, dtype=np.float32)
     
     # Calculate centrality measures
     logger.info("Calculating centrality measures...")
-    degree = np.array([d for _, d in nx_graph.degree()])
+    # A self-loop adds 2 to the degree, as in NetworkX
+    degree = np.bincount(simple_edges.ravel(), minlength=n)
     
-    betweenness = np.zeros(n)
-    btw_dict = nx.betweenness_centrality(nx_graph)
-    for i, val in btw_dict.items():
-        betweenness[i] = val
+    if NUMBA_AVAILABLE:
+        betweenness = betweenness_csr(indptr, indices)
+    else:
+        betweenness = _dict_to_array(nx.betweenness_centrality(nx_graph), n)
     
-    eigenvector = np.zeros(n)
+    # Eigen-family centralities share the sparse adjacency A
     try:
-        eig_dict = nx.eigenvector_centrality_numpy(nx_graph)
-        for i, val in eig_dict.items():
-            eigenvector[i] = val
-    except (nx.NetworkXError, nx.AmbiguousSolution) as e:
+        # The leading eigenvector of a disconnected graph is not unique
+        num_components, _ = connected_components(A, directed=False)
+        if num_components > 1:
+            raise ValueError(f"Graph has {num_components} connected components")
+        eigenvector = fast_eigenvector_centrality(A)
+    except (ValueError, ArpackNoConvergence) as e:
         logger.warning(f"Eigenvector centrality calculation failed: {e}")
         logger.warning("Setting eigenvector centrality to degree centrality as fallback")
         # Use degree centrality as a fallback
-        deg_dict = nx.degree_centrality(nx_graph)
-        for i, val in deg_dict.items():
-            eigenvector[i] = val
+        eigenvector = (degree / max(n - 1, 1)).astype(np.float32)
     
-    pagerank = np.zeros(n)
-    pr_dict = nx.pagerank(nx_graph)
-    for i, val in pr_dict.items():
-        pagerank[i] = val
+    pagerank = fast_pagerank(A)
     
-    closeness = np.zeros(n)
-    close_dict = nx.closeness_centrality(nx_graph)
-    for i, val in close_dict.items():
-        closeness[i] = val
+    if NUMBA_AVAILABLE:
+        closeness = closeness_csr(indptr, indices, dtype=np.float32)
+    else:
+        closeness = _dict_to_array(nx.closeness_centrality(nx_graph), n)
     
-    node_load = np.zeros(n)
-    node_load_dict = nx.load_centrality(nx_graph)
-    for i, val in node_load_dict.items():
-        node_load[i] = val
+    if NUMBA_AVAILABLE:
+        node_load = load_csr(indptr, indices)
+    else:
+        node_load = _dict_to_array(nx.load_centrality(nx_graph), n)
     
     # Create embedder
     logger.info("Creating embedder...")
@@ -113,8 +151,8 @@ def run_benchmark(graph_generator, graph_params, dim=3, L_min=10.0, k_attr=0.5,
     layout_time = time.time() - layout_start
     
     # Get positions and calculate radial distances
-    positions = np.array(embedder.positions)
-    radii = np.linalg.norm(positions, axis=1)
+    positions = np.asarray(embedder.positions, dtype=np.float32)
+    radii = np.linalg.norm(positions, axis=1).astype(np.float32)
     
     # Return benchmark data
     result = {
@@ -171,33 +209,14 @@ def benchmark_correlations(graph_generator, graph_params, dim=2, L_min=10.0, k_a
         num_iterations=num_iterations
     )
     
-    # Calculate correlations with radial distances
-    radii = results['radii']
+    # Calculate correlations with radial distances. Spearman's rho is
+    # Pearson's r on ranks, so the radii are ranked only once.
+    radii_ranks = stats.rankdata(results['radii'])
     correlations = {}
     
-    # Degree correlation
-    rho, p = stats.spearmanr(radii, results['degree'])
-    correlations['degree'] = {'rho': rho, 'p': p}
-    
-    # Betweenness correlation
-    rho, p = stats.spearmanr(radii, results['betweenness'])
-    correlations['betweenness'] = {'rho': rho, 'p': p}
-    
-    # Eigenvector correlation
-    rho, p = stats.spearmanr(radii, results['eigenvector'])
-    correlations['eigenvector'] = {'rho': rho, 'p': p}
-    
-    # PageRank correlation
-    rho, p = stats.spearmanr(radii, results['pagerank'])
-    correlations['pagerank'] = {'rho': rho, 'p': p}
-    
-    # Closeness correlation
-    rho, p = stats.spearmanr(radii, results['closeness'])
-    correlations['closeness'] = {'rho': rho, 'p': p}
-    
-    # Node load correlation
-    rho, p = stats.spearmanr(radii, results['node_load'])
-    correlations['node_load'] = {'rho': rho, 'p': p}
+    for name in ['degree', 'betweenness', 'eigenvector', 'pagerank', 'closeness', 'node_load']:
+        rho, p = stats.pearsonr(radii_ranks, stats.rankdata(results[name]))
+        correlations[name] = {'rho': rho, 'p': p}
     
     # Add correlations to results
     results['correlations'] = correlations
@@ -205,8 +224,66 @@ def benchmark_correlations(graph_generator, graph_params, dim=2, L_min=10.0, k_a
     return results
 
 
+def _estimate_influence(csr, seeds, p, iterations, trials):
+    """
+    Estimate the influence of a seed set as the mean size of trials Independent
+    Cascade runs, with the Numba simulator when available and its NumPy
+    counterpart otherwise.
+    
+    Parameters:
+        csr: tuple
+            (indptr, indices) of the graph
+        seeds: list
+            The list of seed nodes
+        p: float
+            Propagation probability
+        iterations: int
+            Maximum number of propagation steps
+        trials: int
+            Number of Monte-Carlo cascades
+    
+    Returns:
+        float: The estimated influence
+    """
+    simulate = ic_simulate_batch if NUMBA_AVAILABLE else ic_simulate_numpy
+    return simulate(*csr, seeds, p, trials, max_steps=iterations)
+
+
+def _greedy_seed_selection(csr, n, k, p, iterations, trials):
+    """
+    Greedy seed selection that scores candidates with _estimate_influence, so
+    that the seeds are chosen with the same estimate they are evaluated with.
+    
+    Returns:
+        seeds: the selected seed set (list of nodes)
+        num_cascades: the total number of cascades simulated during selection
+    """
+    seeds = []
+    num_cascades = 0
+    
+    for _ in range(k):
+        best_node = None
+        best_influence = -1
+        
+        # Evaluate each node not already in the seed set
+        for node in range(n):
+            if node in seeds:
+                continue
+            influence = _estimate_influence(csr, seeds + [node], p, iterations, trials)
+            num_cascades += trials
+            
+            if influence > best_influence:
+                best_influence = influence
+                best_node = node
+        
+        if best_node is not None:
+            seeds.append(best_node)
+    
+    return seeds, num_cascades
+
+
 def run_influence_benchmark(graph_generator, graph_params, k=10, p=0.1, iterations=200, 
-                           dim=3, num_layout_iterations=20, layout_params=None):
+                           dim=3, num_layout_iterations=20, layout_params=None, trials=100):
     """
     Run a benchmark comparing influence maximization methods.
     
@@ -220,13 +297,16 @@ def run_influence_benchmark(graph_generator, graph_params, k=10, p=0.1, iteratio
         p: float
             Propagation probability
         iterations: int
-            Number of iterations for influence simulation
+            Maximum number of propagation steps per influence simulation
         dim: int
             Embedding dimension
         num_layout_iterations: int
             Number of iterations for layout algorithm
         layout_params: dict
             Parameters for the layout algorithm
+        trials: int
+            Number of Independent Cascade runs averaged in each influence estimate,
+            both when selecting greedy seeds and when evaluating seed sets
     
     Returns:
         dict: Benchmark results comparing influence maximization methods
@@ -246,10 +326,8 @@ def run_influence_benchmark(graph_generator, graph_params, k=10, p=0.1, iteratio
     
     logger.info(f"Generated graph with {n} vertices and {m} edges")
     
-    # Convert to NetworkX graph
-    nx_graph = nx.Graph()
-    nx_graph.add_nodes_from(range(n))
-    nx_graph.add_edges_from(edges)
+    # CSR adjacency shared by all influence simulations
+    csr = edges_to_csr(edges, n)
     
     # Default layout parameters
     if layout_params is None:
@@ -281,28 +359,25 @@ def run_influence_benchmark(graph_generator, graph_params, k=10, p=0.1, iteratio
     # Run greedy seed selection
     logger.info("Running greedy seed selection...")
     greedy_start = time.time()
-    greedy_seeds, greedy_iters = greedy_seed_selection(nx_graph, k, p, iterations)
+    greedy_seeds, greedy_cascades = _greedy_seed_selection(csr, n, k, p, iterations, trials)
     greedy_time = time.time() - greedy_start
     
     # Evaluate influence for GraphEm seeds
     logger.info("Evaluating GraphEm influence...")
     graphem_eval_start = time.time()
-    graphem_influence, _ = ndlib_estimated_influence(nx_graph, graphem_seeds, p, iterations)
+    graphem_influence = _estimate_influence(csr, graphem_seeds, p, iterations, trials)
     graphem_eval_time = time.time() - graphem_eval_start
     
     # Evaluate influence for Greedy seeds
     logger.info("Evaluating Greedy influence...")
     greedy_eval_start = time.time()
-    greedy_influence, _ = ndlib_estimated_influence(nx_graph, greedy_seeds, p, iterations)
+    greedy_influence = _estimate_influence(csr, greedy_seeds, p, iterations, trials)
     greedy_eval_time = time.time() - greedy_eval_start
     
     # Calculate random baseline
     logger.info("Evaluating random baseline...")
-    random_influences = []
-    for _ in range(10):
-        random_seeds = np.random.choice(n, k, replace=False)
-        random_influence, _ = ndlib_estimated_influence(nx_graph, random_seeds, p, iterations)
-        random_influences.append(random_influence)
+    random_influences = [_estimate_influence(csr, np.random.choice(n, k, replace=False), p, iterations, trials)
+                         for _ in range(10)]
     random_influence = np.mean(random_influences)
     
     # Compile results
@@ -310,7 +385,7 @@ def run_influence_benchmark(graph_generator, graph_params, k=10, p=0.1, iteratio
                'greedy_seeds': greedy_seeds, 'graphem_influence': graphem_influence,
                'greedy_influence': greedy_influence, 'random_influence': random_influence, 'graphem_time': graphem_time,
                'greedy_time': greedy_time, 'graphem_eval_time': graphem_eval_time, 'greedy_eval_time': greedy_eval_time,
-               'greedy_iterations': greedy_iters, 'graphem_norm_influence': graphem_influence / n,
+               'greedy_cascades': greedy_cascades, 'graphem_norm_influence': graphem_influence / n,
                'greedy_norm_influence': greedy_influence / n, 'random_norm_influence': random_influence / n}
     
     # Calculate normalized influences
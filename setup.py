@@ -31,6 +31,10 @@ required = [
     "tabulate>=0.9.0"
 ]
 
+fast_required = [
+    "numba>=0.57.0"
+]
+
 docs_required = [
     "sphinx>=4.0.0",
     "sphinx_rtd_theme>=1.0.0",
@@ -48,6 +52,7 @@ setup(
     install_requires=required,
     extras_require={
         "docs": docs_required,
+        "fast": fast_required,
     },
     python_requires=">=3.8",
     classifiers=[